@@ -10,16 +10,14 @@ def main():
     if not log_path.exists():
         sys.exit(f"Log file not found: {log_path}")
 
-    lines = [
-        line.strip()
-        for line in log_path.read_text().splitlines()
-        if "voice_metrics|" in line
-    ]
+    latest = None
+    with log_path.open() as handle:
+        for line in handle:
+            if "voice_metrics|" in line:
+                latest = line.strip()
 
-    if not lines:
+    if latest is None:
         sys.exit("No voice_metrics lines found")
-
-    latest = lines[-1]
     parts = {}
     for chunk in latest.split("|"):
         if "=" in chunk:
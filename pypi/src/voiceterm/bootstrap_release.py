@@ -24,10 +24,3 @@ def _target_platform_triplet() -> tuple[str, str]:
             "Set VOICETERM_NATIVE_BIN or VOICETERM_BOOTSTRAP_MODE=source-only."
         )
     return os_name, arch
-
-
-def _release_asset_names(version: str) -> tuple[str, str]:
-    os_name, arch = _target_platform_triplet()
-    archive = f"voiceterm-{version}-{os_name}-{arch}.tar.gz"
-    checksum = f"{archive}.sha256"
-    return archive, checksum
@@ -16,13 +16,3 @@ def _launcher_version() -> str:
             return __version__
         except Exception:
             return "unknown"
-
-
-def _default_repo_ref() -> str:
-    version = _launcher_version()
-    if version == "unknown":
-        raise RuntimeError(
-            "Cannot detect installed voiceterm package version. "
-            "Set VOICETERM_REPO_REF to an explicit tag/commit."
-        )
-    return f"v{version}"
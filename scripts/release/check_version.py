@@ -13,6 +13,8 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[2]
 
+INIT_VERSION_RE = re.compile(r'^__version__\s*=\s*["\']([^"\']+)["\']', re.M)
+
 
 def _toml(path: Path) -> dict:
     with path.open("rb") as handle:
@@ -32,7 +34,7 @@ def read_versions() -> dict[str, str]:
     init_text = (ROOT / "pypi" / "src" / "voiceterm" / "__init__.py").read_text(
         encoding="utf-8"
     )
-    init_match = re.search(r'^__version__\s*=\s*["\']([^"\']+)["\']', init_text, re.M)
+    init_match = INIT_VERSION_RE.search(init_text)
     if init_match is None:
         raise ValueError("PyPI package __version__ is missing")
 
@@ -7,8 +7,15 @@ from pathlib import Path
 
 
 def compute_sha256(path: Path) -> str:
-    """Compute sha256 digest for one file."""
-    return hashlib.sha256(path.read_bytes()).hexdigest()
+    """Compute sha256 digest for one file without loading it whole."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while True:
+            chunk = handle.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def write_checksum_file(input_path: Path, output_path: Path) -> None:
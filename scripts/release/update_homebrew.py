@@ -7,7 +7,6 @@ import argparse
 import hashlib
 import re
 import sys
-import tempfile
 import urllib.error
 import urllib.request
 from pathlib import Path
@@ -29,11 +28,14 @@ def update_formula(formula: Path, version: str, archive: Path | None = None) ->
 
     url = f"https://github.com/{REPOSITORY}/archive/refs/tags/v{version}.tar.gz"
     if archive is None:
-        with tempfile.NamedTemporaryFile(prefix="voiceterm-", suffix=".tar.gz") as handle:
-            with urllib.request.urlopen(url, timeout=60) as response:  # noqa: S310
-                handle.write(response.read())
-            handle.flush()
-            digest = hashlib.sha256(Path(handle.name).read_bytes()).hexdigest()
+        hasher = hashlib.sha256()
+        with urllib.request.urlopen(url, timeout=60) as response:  # noqa: S310
+            while True:
+                chunk = response.read(1024 * 1024)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        digest = hasher.hexdigest()
     else:
         digest = hashlib.sha256(archive.read_bytes()).hexdigest()
 
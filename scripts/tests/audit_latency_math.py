@@ -92,127 +92,126 @@ def expected_math(stt_ms: Optional[int], speech_ms: Optional[int]) -> str:
 
 
 def audit_file(log_path: Path, rtf_tolerance: float, max_report: int) -> tuple[int, list[Mismatch]]:
-    lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
     mismatches: list[Mismatch] = []
     latency_line_count = 0
 
-    for line_no, line in enumerate(lines, start=1):
-        fields = parse_latency_audit_fields(line)
-        if fields is None:
-            continue
-        latency_line_count += 1
-
-        stt_ms = parse_optional_u32(fields.get("stt_ms", "na"))
-        speech_ms = parse_optional_u32(fields.get("speech_ms", "na"))
-        display_ms = parse_optional_u32(fields.get("display_ms", "na"))
-        rtf_logged = parse_optional_float(fields.get("rtf", "na"))
-        mode = fields.get("mode", "na")
-        badge = fields.get("badge", "na")
-        math_field = fields.get("math", "na")
-        source = fields.get("source", "na")
-        pipeline = fields.get("pipeline", "na")
-
-        expected_display = "na" if stt_ms is None else str(stt_ms)
-        if fields.get("display_ms", "na") != expected_display:
-            mismatches.append(
-                Mismatch(
-                    line_no=line_no,
-                    field="display_ms",
-                    expected=expected_display,
-                    actual=fields.get("display_ms", "na"),
+    with log_path.open(encoding="utf-8", errors="replace") as handle:
+        for line_no, line in enumerate(handle, start=1):
+            fields = parse_latency_audit_fields(line)
+            if fields is None:
+                continue
+            latency_line_count += 1
+
+            stt_ms = parse_optional_u32(fields.get("stt_ms", "na"))
+            speech_ms = parse_optional_u32(fields.get("speech_ms", "na"))
+            display_ms = parse_optional_u32(fields.get("display_ms", "na"))
+            rtf_logged = parse_optional_float(fields.get("rtf", "na"))
+            mode = fields.get("mode", "na")
+            badge = fields.get("badge", "na")
+            math_field = fields.get("math", "na")
+            source = fields.get("source", "na")
+            pipeline = fields.get("pipeline", "na")
+
+            expected_display = "na" if stt_ms is None else str(stt_ms)
+            if fields.get("display_ms", "na") != expected_display:
+                mismatches.append(
+                    Mismatch(
+                        line_no=line_no,
+                        field="display_ms",
+                        expected=expected_display,
+                        actual=fields.get("display_ms", "na"),
+                    )
                 )
-            )
 
-        expected_source = "na" if stt_ms is None else "stt"
-        if source != expected_source:
-            mismatches.append(
-                Mismatch(
-                    line_no=line_no,
-                    field="source",
-                    expected=expected_source,
-                    actual=source,
+            expected_source = "na" if stt_ms is None else "stt"
+            if source != expected_source:
+                mismatches.append(
+                    Mismatch(
+                        line_no=line_no,
+                        field="source",
+                        expected=expected_source,
+                        actual=source,
+                    )
                 )
-            )
 
-        if pipeline not in {"rust", "python"}:
-            mismatches.append(
-                Mismatch(
-                    line_no=line_no,
-                    field="pipeline",
-                    expected="rust|python",
-                    actual=pipeline,
+            if pipeline not in {"rust", "python"}:
+                mismatches.append(
+                    Mismatch(
+                        line_no=line_no,
+                        field="pipeline",
+                        expected="rust|python",
+                        actual=pipeline,
+                    )
                 )
-            )
 
-        rtf_expected: Optional[float] = None
-        if stt_ms is not None and speech_ms is not None and speech_ms > 0:
-            rtf_expected = stt_ms / speech_ms
+            rtf_expected: Optional[float] = None
+            if stt_ms is not None and speech_ms is not None and speech_ms > 0:
+                rtf_expected = stt_ms / speech_ms
+
+            if rtf_expected is None:
+                if fields.get("rtf", "na") != "na":
+                    mismatches.append(
+                        Mismatch(
+                            line_no=line_no,
+                            field="rtf",
+                            expected="na",
+                            actual=fields.get("rtf", "na"),
+                        )
+                    )
+            else:
+                if rtf_logged is None:
+                    mismatches.append(
+                        Mismatch(
+                            line_no=line_no,
+                            field="rtf",
+                            expected=f"{rtf_expected:.3f}",
+                            actual=fields.get("rtf", "na"),
+                        )
+                    )
+                elif abs(rtf_logged - rtf_expected) > rtf_tolerance:
+                    mismatches.append(
+                        Mismatch(
+                            line_no=line_no,
+                            field="rtf",
+                            expected=f"{rtf_expected:.3f}",
+                            actual=f"{rtf_logged:.3f}",
+                        )
+                    )
 
-        if rtf_expected is None:
-            if fields.get("rtf", "na") != "na":
+            expected_math_field = expected_math(stt_ms, speech_ms)
+            if math_field != expected_math_field:
                 mismatches.append(
                     Mismatch(
                         line_no=line_no,
-                        field="rtf",
-                        expected="na",
-                        actual=fields.get("rtf", "na"),
+                        field="math",
+                        expected=expected_math_field,
+                        actual=math_field,
                     )
                 )
-        else:
-            if rtf_logged is None:
+
+            badge_rtf = rtf_logged if rtf_logged is not None else rtf_expected
+            expected_badge_text = expected_badge(mode, stt_ms, badge_rtf)
+            if badge != expected_badge_text:
                 mismatches.append(
                     Mismatch(
                         line_no=line_no,
-                        field="rtf",
-                        expected=f"{rtf_expected:.3f}",
-                        actual=fields.get("rtf", "na"),
+                        field="badge",
+                        expected=expected_badge_text,
+                        actual=badge,
                     )
                 )
-            elif abs(rtf_logged - rtf_expected) > rtf_tolerance:
+
+            if display_ms is None and stt_ms is not None:
                 mismatches.append(
                     Mismatch(
                         line_no=line_no,
-                        field="rtf",
-                        expected=f"{rtf_expected:.3f}",
-                        actual=f"{rtf_logged:.3f}",
+                        field="display_ms_parse",
+                        expected=str(stt_ms),
+                        actual=fields.get("display_ms", "na"),
                     )
                 )
 
-        expected_math_field = expected_math(stt_ms, speech_ms)
-        if math_field != expected_math_field:
-            mismatches.append(
-                Mismatch(
-                    line_no=line_no,
-                    field="math",
-                    expected=expected_math_field,
-                    actual=math_field,
-                )
-            )
-
-        badge_rtf = rtf_logged if rtf_logged is not None else rtf_expected
-        expected_badge_text = expected_badge(mode, stt_ms, badge_rtf)
-        if badge != expected_badge_text:
-            mismatches.append(
-                Mismatch(
-                    line_no=line_no,
-                    field="badge",
-                    expected=expected_badge_text,
-                    actual=badge,
-                )
-            )
-
-        if display_ms is None and stt_ms is not None:
-            mismatches.append(
-                Mismatch(
-                    line_no=line_no,
-                    field="display_ms_parse",
-                    expected=str(stt_ms),
-                    actual=fields.get("display_ms", "na"),
-                )
-            )
-
-    if len(mismatches) > max_report:
-        mismatches = mismatches[:max_report]
+    del mismatches[max_report:]
     return latency_line_count, mismatches
 
 
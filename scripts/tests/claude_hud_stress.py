@@ -54,11 +54,20 @@ LOG_PATTERNS = {
 }
 STRESS_SESSION_PREFIX = "vt_hud_stress_"
 
+# Single alternation per marker set so each viewport line is scanned once
+# instead of once per marker.
+HUD_MARKER_RE = re.compile("|".join(re.escape(marker) for marker in HUD_MARKERS))
+APPROVAL_MARKER_RE = re.compile(
+    "|".join(re.escape(marker) for marker in APPROVAL_MARKERS)
+)
+
 SUPPRESSION_TRANSITION_RE = re.compile(
-    r"^\[(?P<ts>\d+)\].*\[claude-hud-debug\] suppression transition (?P<prev>true|false) -> (?P<next>true|false)"
+    r"^\[(?P<ts>\d+)\].*\[claude-hud-debug\] suppression transition (?P<prev>true|false) -> (?P<next>true|false)",
+    re.ASCII,
 )
 REDRAW_COMMITTED_RE = re.compile(
-    r"^\[(?P<ts>\d+)\].*\[claude-hud-debug\] redraw committed .*banner_height=(?P<banner>\d+).*prompt_suppressed=Some\((?P<supp>true|false)\)"
+    r"^\[(?P<ts>\d+)\].*\[claude-hud-debug\] redraw committed .*banner_height=(?P<banner>\d+).*prompt_suppressed=Some\((?P<supp>true|false)\)",
+    re.ASCII,
 )
 
 
@@ -82,6 +91,8 @@ class StressRunner:
         self.rust_dir = self.repo_root / "rust"
         self.artifacts_dir = Path(args.artifacts_dir).resolve()
         self.frames_dir = self.artifacts_dir / "frames"
+        self.viewport_rows = max(1, int(args.viewport_rows))
+        self.hud_bottom_rows = max(1, int(args.hud_bottom_rows))
         self.session = f"{STRESS_SESSION_PREFIX}{os.getpid()}"
         self.log_path = self.artifacts_dir / "voiceterm_tui.log"
         self.frames: List[FrameResult] = []
@@ -200,12 +211,11 @@ class StressRunner:
         text = path.read_text(errors="ignore") if path.exists() else ""
         viewport_lines = self._viewport_lines(text)
         viewport_text = "\n".join(viewport_lines)
-        hud_marker_rows = self._marker_rows(viewport_lines, HUD_MARKERS)
-        approval_marker_rows = self._marker_rows(viewport_lines, APPROVAL_MARKERS)
+        hud_marker_rows = self._marker_rows(viewport_lines, HUD_MARKER_RE)
+        approval_marker_rows = self._marker_rows(viewport_lines, APPROVAL_MARKER_RE)
         hud_visible = len(hud_marker_rows) > 0
         approval_visible = len(approval_marker_rows) > 0
-        bottom_rows = max(1, int(self.args.hud_bottom_rows))
-        bottom_start_row = max(1, len(viewport_lines) - bottom_rows + 1)
+        bottom_start_row = max(1, len(viewport_lines) - self.hud_bottom_rows + 1)
         hud_visible_bottom = any(row >= bottom_start_row for row in hud_marker_rows)
         excerpt = "\n".join(viewport_lines[-14:])
         frame = FrameResult(
@@ -230,13 +240,12 @@ class StressRunner:
         lines = cleaned.splitlines()
         if not lines:
             return [cleaned] if cleaned else []
-        viewport_rows = max(1, int(self.args.viewport_rows))
-        return lines[-viewport_rows:]
+        return lines[-self.viewport_rows:]
 
-    def _marker_rows(self, lines: List[str], markers: tuple[str, ...]) -> List[int]:
+    def _marker_rows(self, lines: List[str], marker_re: re.Pattern[str]) -> List[int]:
         rows: List[int] = []
         for index, line in enumerate(lines, start=1):
-            if any(marker in line for marker in markers):
+            if marker_re.search(line):
                 rows.append(index)
         return rows
 
@@ -257,10 +266,10 @@ class StressRunner:
     def _drive_stress_prompt(self) -> None:
         self._stuff(self.args.prompt)
         self._stuff("\n")
-        started = time.time()
+        started = time.monotonic()
 
         frame_idx = 2
-        while time.time() - started < self.args.run_seconds:
+        while time.monotonic() - started < self.args.run_seconds:
             time.sleep(self.args.poll_interval_s)
             frame = self._hardcopy(frame_idx)
             frame_idx += 1
@@ -283,28 +292,26 @@ class StressRunner:
         self._run_best_effort(["screen", "-S", self.session, "-X", "quit"])
         self._session_started = False
 
-    def _count_log_patterns(self) -> Dict[str, int]:
+    def _scan_log(self) -> tuple[Dict[str, int], Dict[str, List[Dict[str, object]]]]:
+        # Pattern counting and event parsing share one pass so the log file is
+        # read exactly once even when it grows large during long runs.
         counts = {key: 0 for key in LOG_PATTERNS}
-        if not self.log_path.exists():
-            return counts
-
-        with self.log_path.open("r", errors="ignore") as handle:
-            for line in handle:
-                for key, pattern in LOG_PATTERNS.items():
-                    if pattern in line:
-                        counts[key] += 1
-        return counts
-
-    def _parse_log_events(self) -> Dict[str, List[Dict[str, object]]]:
         events: Dict[str, List[Dict[str, object]]] = {
             "suppression_transitions": [],
             "redraw_commits": [],
         }
         if not self.log_path.exists():
-            return events
+            return counts, events
 
         with self.log_path.open("r", errors="ignore") as handle:
             for line in handle:
+                # Every pattern and regex below contains this marker, so the
+                # cheap substring test rejects unrelated log lines up front.
+                if "[claude-hud-" not in line:
+                    continue
+                for key, pattern in LOG_PATTERNS.items():
+                    if pattern in line:
+                        counts[key] += 1
                 suppression_match = SUPPRESSION_TRANSITION_RE.search(line)
                 if suppression_match:
                     events["suppression_transitions"].append(
@@ -323,7 +330,7 @@ class StressRunner:
                             "prompt_suppressed": redraw_match.group("supp") == "true",
                         }
                     )
-        return events
+        return counts, events
 
     def _latest_event_before_or_at(
         self, events: List[Dict[str, object]], timestamp: float
@@ -394,8 +401,7 @@ class StressRunner:
         return correlations
 
     def _summarize(self) -> Dict[str, object]:
-        log_counts = self._count_log_patterns()
-        log_events = self._parse_log_events()
+        log_counts, log_events = self._scan_log()
         frame_correlations = self._correlate_frames_with_logs(log_events)
         frame_correlation_by_index = {
             int(correlation["index"]): correlation for correlation in frame_correlations
@@ -500,7 +506,7 @@ class StressRunner:
         summary_json = self.artifacts_dir / "summary.json"
         summary_md = self.artifacts_dir / "summary.md"
 
-        summary_json.write_text(json.dumps(summary, indent=2) + "\n")
+        summary_json.write_bytes((json.dumps(summary, indent=2) + "\n").encode("utf-8"))
 
         lines = [
             "# Claude HUD Stress Summary",
@@ -545,7 +551,7 @@ class StressRunner:
             ]
         )
 
-        summary_md.write_text("\n".join(lines) + "\n")
+        summary_md.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
         if self.log_path.exists():
             dst_log_path = self.artifacts_dir / "voiceterm_tui.log"
@@ -555,12 +561,15 @@ class StressRunner:
                 shutil.copy2(self.log_path, dst_log_path)
 
     def _print_summary(self, summary: Dict[str, object]) -> None:
-        print("artifacts_dir:", summary["artifacts_dir"])
-        print("log_path:", summary["log_path"])
-        print("frame_count:", summary["frame_count"])
-        print("approvals_sent:", summary["approvals_sent"])
-        print("anomaly_total:", summary["anomaly_total"])
-        print("anomalies:", json.dumps(summary["anomalies"], indent=2))
+        lines = [
+            f"artifacts_dir: {summary['artifacts_dir']}",
+            f"log_path: {summary['log_path']}",
+            f"frame_count: {summary['frame_count']}",
+            f"approvals_sent: {summary['approvals_sent']}",
+            f"anomaly_total: {summary['anomaly_total']}",
+            f"anomalies: {json.dumps(summary['anomalies'], indent=2)}",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def parse_args() -> argparse.Namespace: